@@ -440,7 +440,7 @@ def send_notification(stats, duration, start_date, end_date):
             end_date=end_date,
             duration=duration
         )
-        logger.info("✅ Email notification sent")
+        logger.info("✅ Email notification queued")
     except Exception as e:
         logger.warning(f"⚠️  Email failed: {e}")
 
@@ -334,7 +334,7 @@ Status: ✅ SUCCESS
         else:
             send_failure_email(f"No data inserted. Check logs.")
         
-        logger.info("✅ Email notification sent")
+        logger.info("✅ Email notification queued")
     
     except Exception as e:
         logger.warning(f"⚠️  Could not send email: {e}")
@@ -42,7 +42,7 @@ load_dotenv()
 
 # Try to import notifications (optional)
 try:
-    from src.utils.notifications import send_email_alert
+    from src.utils.notifications import enqueue_email_alert
     EMAIL_AVAILABLE = True
 except ImportError:
     EMAIL_AVAILABLE = False
@@ -420,8 +420,8 @@ Next Steps:
 ---
 This is an automated message from Nusantara Food Watch.
 """
-                send_email_alert(subject, body, is_html=False, is_error=False)
-                print("✅ Email sent successfully")
+                enqueue_email_alert(subject, body, is_html=False, is_error=False)
+                print("✅ Email queued for sending")
             except Exception as e:
                 print(f"⚠️ Failed to send email: {e}")
         
@@ -446,7 +446,7 @@ This is an automated message from Nusantara Food Watch.
         # Send failure email
         if not args.no_email and EMAIL_AVAILABLE:
             try:
-                send_email_alert(
+                enqueue_email_alert(
                     "Database Migration Failed",
                     f"Error: {str(e)}\n\n{traceback.format_exc()}",
                     is_html=False,
@@ -23,9 +23,16 @@ For GitHub Actions:
    - ALERT_EMAIL
 """
 
+import atexit
+import logging
+import queue
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import socket
+import threading
+import uuid
+from email.message import EmailMessage
+from email.utils import formatdate
+from functools import lru_cache
 from datetime import datetime
 import os
 from typing import Optional
@@ -33,9 +40,133 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
 # SMTP Configuration for Gmail
 SMTP_SERVER = 'smtp.gmail.com'
 SMTP_PORT = 587  # TLS port
+SMTP_TIMEOUT = 30  # seconds, so a dead connection fails in bounded time
+
+# Outbound mail queue drained by a single background worker
+MAIL_QUEUE_SIZE = 100
+ENQUEUE_TIMEOUT = 10  # seconds an error email waits for queue space
+FLUSH_TIMEOUT = 60  # max seconds to wait for pending mail at exit
+_MAIL_QUEUE: queue.Queue = queue.Queue(maxsize=MAIL_QUEUE_SIZE)
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+# Credentials are read once; .env is loaded at import and doesn't change
+_SENDER_EMAIL = os.getenv('EMAIL_ADDRESS')
+_SENDER_PASSWORD = os.getenv('EMAIL_APP_PASSWORD')
+_RECEIVER_EMAIL = os.getenv('ALERT_EMAIL')
+_CREDS_OK = all([_SENDER_EMAIL, _SENDER_PASSWORD, _RECEIVER_EMAIL])
+
+
+def reload_credentials() -> bool:
+    """
+    Re-read email credentials from the environment
+    (e.g. after tests modify os.environ)
+    
+    Returns:
+        True if all credentials are set
+    """
+    global _SENDER_EMAIL, _SENDER_PASSWORD, _RECEIVER_EMAIL, _CREDS_OK
+    
+    _SENDER_EMAIL = os.getenv('EMAIL_ADDRESS')
+    _SENDER_PASSWORD = os.getenv('EMAIL_APP_PASSWORD')
+    _RECEIVER_EMAIL = os.getenv('ALERT_EMAIL')
+    _CREDS_OK = all([_SENDER_EMAIL, _SENDER_PASSWORD, _RECEIVER_EMAIL])
+    
+    # Drop any connection logged in with the old credentials
+    with _smtp_connection.lock:
+        _smtp_connection.close()
+    
+    return _CREDS_OK
+
+
+class SMTPConnection:
+    """
+    Persistent SMTP connection reused across sends
+    
+    The connection is checked with NOOP before reuse and reopened
+    transparently if the server has dropped it (e.g. idle timeout
+    during a long backfill).
+    """
+    
+    def __init__(self, server: str = SMTP_SERVER, port: int = SMTP_PORT):
+        self.server = server
+        self.port = port
+        self._smtp: Optional[smtplib.SMTP] = None
+        self.lock = threading.Lock()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new connection"""
+        self.close()
+        
+        smtp = smtplib.SMTP(self.server, self.port, timeout=SMTP_TIMEOUT)
+        try:
+            smtp.starttls()  # Upgrade to secure connection
+            smtp.login(_SENDER_EMAIL, _SENDER_PASSWORD)
+        except Exception:
+            smtp.close()
+            raise
+        
+        self._smtp = smtp
+        return smtp
+    
+    def _healthy(self) -> bool:
+        """Check whether the current connection is still usable"""
+        try:
+            code, _ = self._smtp.noop()
+            return code == 250
+        except (smtplib.SMTPServerDisconnected, OSError):
+            return False
+    
+    def get_connection(self) -> smtplib.SMTP:
+        """Return a live connection, reconnecting if needed"""
+        if self._smtp is not None and self._healthy():
+            return self._smtp
+        return self._connect()
+    
+    def close(self) -> None:
+        """Close the connection (safe to call repeatedly)"""
+        if self._smtp is None:
+            return
+        
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        finally:
+            self._smtp = None
+
+
+_smtp_connection = SMTPConnection()
+
+
+def _close_connection_at_exit() -> None:
+    """Close the SMTP connection unless the mail worker is still using it"""
+    if not _smtp_connection.lock.acquire(blocking=False):
+        # Worker is mid-send (flush timed out); don't QUIT over its DATA
+        return
+    
+    try:
+        _smtp_connection.close()
+    finally:
+        _smtp_connection.lock.release()
+
+
+atexit.register(_close_connection_at_exit)
+
+
+@lru_cache(maxsize=1)
+def _get_hostname() -> str:
+    """Resolve the local hostname for Message-ID headers (on first send only)"""
+    return socket.getfqdn()
 
 
 def send_email_alert(
@@ -57,105 +188,184 @@ def send_email_alert(
         True if sent successfully, False otherwise
     """
     
-    # Get credentials from environment
-    sender_email = os.getenv('EMAIL_ADDRESS')
-    sender_password = os.getenv('EMAIL_APP_PASSWORD')
-    receiver_email = os.getenv('ALERT_EMAIL')
-    
     # Validate credentials
-    if not all([sender_email, sender_password, receiver_email]):
-        print("⚠️ Email credentials not configured!")
-        print("Missing:")
-        if not sender_email:
-            print("  - EMAIL_ADDRESS")
-        if not sender_password:
-            print("  - EMAIL_APP_PASSWORD")
-        if not receiver_email:
-            print("  - ALERT_EMAIL")
+    if not _CREDS_OK:
+        missing = [
+            name for name, value in (
+                ('EMAIL_ADDRESS', _SENDER_EMAIL),
+                ('EMAIL_APP_PASSWORD', _SENDER_PASSWORD),
+                ('ALERT_EMAIL', _RECEIVER_EMAIL),
+            ) if not value
+        ]
+        logger.warning(
+            f"⚠️ Email credentials not configured! Missing: {', '.join(missing)}"
+        )
         return False
     
     # Add prefix to subject
     prefix = "[ERROR] " if is_error else "[INFO] "
     full_subject = f"{prefix}Nusantara Food Watch - {subject}"
     
-    # Create message
-    msg = MIMEMultipart('alternative')
-    msg['From'] = sender_email
-    msg['To'] = receiver_email
+    # Create single-part message (no multipart wrapper needed)
+    msg = EmailMessage()
+    msg['From'] = _SENDER_EMAIL
+    msg['To'] = _RECEIVER_EMAIL
     msg['Subject'] = full_subject
-    
-    # Attach body
-    mime_type = 'html' if is_html else 'plain'
-    msg.attach(MIMEText(body, mime_type))
+    msg['Date'] = formatdate(localtime=True)
+    msg['Message-ID'] = f"<{uuid.uuid4().hex}@{_get_hostname()}>"
+    msg.set_content(body, subtype='html' if is_html else 'plain')
     
     try:
-        # Connect to Gmail SMTP server
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()  # Upgrade to secure connection
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
+        # Reuse the persistent Gmail SMTP connection
+        with _smtp_connection.lock:
+            try:
+                server = _smtp_connection.get_connection()
+                server.send_message(msg)
+            except (smtplib.SMTPException, OSError):
+                _smtp_connection.close()
+                raise
         
-        print(f"✅ Email sent successfully to {receiver_email}")
+        logger.info(f"✅ Email sent successfully to {_RECEIVER_EMAIL}")
         return True
         
     except smtplib.SMTPAuthenticationError:
-        print("❌ Email authentication failed!")
-        print("Check:")
-        print("  1. EMAIL_ADDRESS is correct")
-        print("  2. EMAIL_APP_PASSWORD is app password (not regular password)")
-        print("  3. 2FA is enabled on Gmail")
+        logger.error(
+            "❌ Email authentication failed! Check:\n"
+            "  1. EMAIL_ADDRESS is correct\n"
+            "  2. EMAIL_APP_PASSWORD is app password (not regular password)\n"
+            "  3. 2FA is enabled on Gmail"
+        )
         return False
         
     except smtplib.SMTPException as e:
-        print(f"❌ SMTP error: {e}")
+        logger.error(f"❌ SMTP error: {e}")
         return False
         
-    except Exception as e:
-        print(f"❌ Unexpected error sending email: {e}")
+    except Exception:
+        logger.exception("❌ Unexpected error sending email")
         return False
 
 
-def send_scrape_success_email(records_count: int = 0) -> None:
+def _drain_loop() -> None:
+    """Worker loop: send queued emails one at a time"""
+    while True:
+        item = _MAIL_QUEUE.get()
+        try:
+            send_email_alert(**item)  # logs its own errors
+        finally:
+            _MAIL_QUEUE.task_done()
+
+
+def _ensure_worker() -> None:
+    """Start the mail worker thread on first use"""
+    global _worker
+    
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_drain_loop, name="mail-worker", daemon=True
+            )
+            _worker.start()
+
+
+def flush_email_queue(timeout: float = FLUSH_TIMEOUT) -> bool:
     """
-    Send success notification email after scraping
+    Wait for queued emails to be sent, up to timeout seconds
     
     Args:
-        records_count: Number of records inserted
+        timeout: Overall deadline for the whole queue
+    
+    Returns:
+        True if the queue drained, False if the deadline passed
     """
+    if _worker is None or not _worker.is_alive():
+        return True
     
-    import os
-    import smtplib
-    from email.mime.text import MIMEText
-    from email.mime.multipart import MIMEMultipart
-    from datetime import datetime
+    # Queue.join() has no timeout, so wait on it from a helper thread
+    joiner = threading.Thread(
+        target=_MAIL_QUEUE.join, name="mail-flush", daemon=True
+    )
+    joiner.start()
+    joiner.join(timeout)
+    
+    if joiner.is_alive():
+        logger.warning(
+            f"⚠️ Email flush timed out after {timeout}s, "
+            f"{_MAIL_QUEUE.qsize()} queued email(s) not sent"
+        )
+        return False
     
-    # Get email credentials from environment
-    email_from = os.getenv('EMAIL_ADDRESS')
-    email_to = os.getenv('ALERT_EMAIL')
-    email_password = os.getenv('EMAIL_APP_PASSWORD')
+    return True
+
+
+atexit.register(flush_email_queue)
+
+
+def enqueue_email_alert(
+    subject: str,
+    body: str,
+    is_html: bool = False,
+    is_error: bool = False
+) -> bool:
+    """
+    Queue email alert for background sending (returns immediately)
     
-    if not all([email_from, email_to, email_password]):
-        print("⚠️  Email not configured, skipping notification")
-        return
+    Info emails are dropped when the queue is full; error emails
+    wait up to ENQUEUE_TIMEOUT seconds for room before being dropped.
+    
+    Args:
+        subject: Email subject
+        body: Email body content
+        is_html: Whether body is HTML formatted
+        is_error: True for error emails (adds [ERROR] prefix)
     
-    # Create email
-    msg = MIMEMultipart()
-    msg['From'] = email_from
-    msg['To'] = email_to
-    msg['Subject'] = f"✅ Daily Scrape Success - {records_count:,} records"  # ✅ FIXED: Removed 's'
+    Returns:
+        True if queued, False if dropped
+    """
+    _ensure_worker()
+    
+    item = {
+        'subject': subject,
+        'body': body,
+        'is_html': is_html,
+        'is_error': is_error,
+    }
+    
+    try:
+        if is_error:
+            _MAIL_QUEUE.put(item, timeout=ENQUEUE_TIMEOUT)
+        else:
+            _MAIL_QUEUE.put_nowait(item)
+        return True
+    except queue.Full:
+        logger.warning(f"⚠️ Email queue full, dropping: {subject}")
+        return False
+
+
+def send_scrape_success_email(records_count: int = 0) -> bool:
+    """
+    Send success notification email after scraping
+    
+    Args:
+        records_count: Number of records inserted
+    
+    Returns:
+        True if queued for sending
+    """
+    
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    # Email body - FIXED: All format specs corrected
     body = f"""
 Nusantara Food Watch - Daily Scrape Report
 ==========================================
 
-Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Date: {timestamp}
 
 Status: ✅ SUCCESS
 
 Results:
 --------
-Records inserted: {records_count:,}  # ✅ FIXED: No 's' here
+Records inserted: {records_count:,}
 Database updated successfully
 
 Next Steps:
@@ -169,21 +379,9 @@ Automated by Nusantara Food Watch
 GitHub Actions Daily Scraper
 """
     
-    msg.attach(MIMEText(body, 'plain'))
-    
-    # Send email
-    try:
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-        server.starttls()
-        server.login(email_from, email_password)
-        server.send_message(msg)
-        server.quit()
-        
-        print("✅ Success email sent")
+    subject = f"Daily Scrape Success - {records_count:,} records"
     
-    except Exception as e:
-        print(f"❌ Failed to send email: {e}")
-
+    return enqueue_email_alert(subject, body, is_html=False, is_error=False)
 
 
 def send_scrape_failure_email(
@@ -200,12 +398,12 @@ def send_scrape_failure_email(
         traceback_info: Full traceback (optional)
     
     Returns:
-        True if sent successfully
+        True if queued for sending
     """
     
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    body = f"""
+    parts = [f"""
 Nusantara Food Watch - Scraper Failure Alert
 {'=' * 60}
 
@@ -218,17 +416,17 @@ ERROR DETAILS
 Type: {error_type}
 Message: {error_message}
 
-"""
+"""]
     
     if traceback_info:
-        body += f"""
+        parts.append(f"""
 FULL TRACEBACK
 --------------
 {traceback_info}
 
-"""
+""")
     
-    body += """
+    parts.append("""
 RECOMMENDED ACTIONS
 -------------------
 1. Check GitHub Actions logs
@@ -247,11 +445,12 @@ To manually trigger scraper:
 ---
 This is an automated alert from Nusantara Food Watch scraper.
 Please respond ASAP to minimize data gaps.
-"""
+""")
+    body = "".join(parts)
     
     subject = f"Scraper Failed - {error_type}"
     
-    return send_email_alert(subject, body, is_html=False, is_error=True)
+    return enqueue_email_alert(subject, body, is_html=False, is_error=True)
 
 
 def send_backfill_complete_email(
@@ -270,12 +469,12 @@ def send_backfill_complete_email(
         duration: Execution time in seconds
     
     Returns:
-        True if sent successfully
+        True if queued for sending
     """
     
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    body = f"""
+    parts = [f"""
 Nusantara Food Watch - Backfill Complete
 {'=' * 60}
 
@@ -286,14 +485,14 @@ BACKFILL SUMMARY
 Status: ✅ Complete
 Total Records: {total_records:,}
 Date Range: {start_date} to {end_date}
-"""
+"""]
     
     if duration:
         minutes = int(duration // 60)
         seconds = int(duration % 60)
-        body += f"Duration: {minutes}m {seconds}s\n"
+        parts.append(f"Duration: {minutes}m {seconds}s\n")
     
-    body += """
+    parts.append("""
 
 WHAT'S NEXT
 -----------
@@ -304,11 +503,12 @@ WHAT'S NEXT
 
 ---
 This is an automated message from Nusantara Food Watch.
-"""
+""")
+    body = "".join(parts)
     
     subject = f"Backfill Complete - {total_records:,} records loaded"
     
-    return send_email_alert(subject, body, is_html=False, is_error=False)
+    return enqueue_email_alert(subject, body, is_html=False, is_error=False)
 
 
 def send_test_email() -> bool:
@@ -332,8 +532,8 @@ Timestamp: {timestamp}
 If you're receiving this, your email configuration is correct!
 
 Configuration Details:
-- Sender: {os.getenv('EMAIL_ADDRESS', 'NOT SET')}
-- Receiver: {os.getenv('ALERT_EMAIL', 'NOT SET')}
+- Sender: {_SENDER_EMAIL or 'NOT SET'}
+- Receiver: {_RECEIVER_EMAIL or 'NOT SET'}
 - SMTP Server: {SMTP_SERVER}:{SMTP_PORT}
 
 Next Steps:
@@ -376,37 +576,59 @@ if __name__ == "__main__":
     print("EMAIL CONFIGURATION TEST")
     print("=" * 70)
     
-    # Check environment variables
-    print("\n1. Checking environment variables...")
-    email_address = os.getenv('EMAIL_ADDRESS')
-    email_password = os.getenv('EMAIL_APP_PASSWORD')
-    alert_email = os.getenv('ALERT_EMAIL')
-    
-    if email_address:
-        print(f"   ✓ EMAIL_ADDRESS: {email_address}")
-    else:
-        print("   ✗ EMAIL_ADDRESS: NOT SET")
+    from concurrent.futures import Future, ThreadPoolExecutor
     
-    if email_password:
-        print(f"   ✓ EMAIL_APP_PASSWORD: {'*' * 16}")
-    else:
-        print("   ✗ EMAIL_APP_PASSWORD: NOT SET")
-    
-    if alert_email:
-        print(f"   ✓ ALERT_EMAIL: {alert_email}")
-    else:
-        print("   ✗ ALERT_EMAIL: NOT SET")
+    def _close_probe_socket(future: Future) -> None:
+        """Close the probe socket once connected (we only test reachability)"""
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
     
-    if not all([email_address, email_password, alert_email]):
-        print("\n❌ Configuration incomplete!")
-        print("\nAdd to .env file:")
-        print("EMAIL_ADDRESS=your-email@gmail.com")
-        print("EMAIL_APP_PASSWORD=your-16-char-app-password")
-        print("ALERT_EMAIL=recipient@email.com")
-        exit(1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Start SMTP connectivity probe in background (overlaps DNS + TCP handshake)
+        probe = executor.submit(socket.create_connection, (SMTP_SERVER, SMTP_PORT), 5)
+        probe.add_done_callback(_close_probe_socket)
+        
+        # Check environment variables
+        print("\n1. Checking environment variables...")
+        email_address = _SENDER_EMAIL
+        email_password = _SENDER_PASSWORD
+        alert_email = _RECEIVER_EMAIL
+        
+        if email_address:
+            print(f"   ✓ EMAIL_ADDRESS: {email_address}")
+        else:
+            print("   ✗ EMAIL_ADDRESS: NOT SET")
+        
+        if email_password:
+            print(f"   ✓ EMAIL_APP_PASSWORD: {'*' * 16}")
+        else:
+            print("   ✗ EMAIL_APP_PASSWORD: NOT SET")
+        
+        if alert_email:
+            print(f"   ✓ ALERT_EMAIL: {alert_email}")
+        else:
+            print("   ✗ ALERT_EMAIL: NOT SET")
+        
+        if not _CREDS_OK:
+            print("\n❌ Configuration incomplete!")
+            print("\nAdd to .env file:")
+            print("EMAIL_ADDRESS=your-email@gmail.com")
+            print("EMAIL_APP_PASSWORD=your-16-char-app-password")
+            print("ALERT_EMAIL=recipient@email.com")
+            exit(1)
+        
+        # Check SMTP connectivity
+        print(f"\n2. Checking connection to {SMTP_SERVER}:{SMTP_PORT}...")
+        try:
+            probe.result()
+            print("   ✓ SMTP server reachable")
+        except OSError as e:
+            print(f"   ✗ Cannot reach SMTP server: {e}")
+            print("\nCheck network/firewall settings (outbound port 587)")
+            exit(1)
     
     # Send test email
-    print("\n2. Sending test email...")
+    print("\n3. Sending test email...")
     success = send_test_email()
     
     if success: